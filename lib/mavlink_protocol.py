@@ -8,7 +8,9 @@ This protocol uses pymavlink to handle all MAVLink complexity:
 - MAVLink v2 packet truncation
 - Field extraction and byte ordering
 
-The protocol outputs JSON that COSMOS reads using JsonAccessor.
+The protocol outputs JSON that COSMOS reads using JsonAccessor. orjson is
+used for the JSON encoding when it is installed, with the standard library
+json module as a fallback.
 """
 
 from openc3.interfaces.protocols.protocol import Protocol
@@ -16,6 +18,12 @@ from pymavlink.dialects.v20 import all as mavlink2
 import json
 import logging
 import math
+import struct
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +47,51 @@ def sanitize_for_json(obj):
         return obj
 
 
+def _bytes_to_list(obj):
+    """orjson default hook: serialize raw byte fields as lists of ints"""
+    if isinstance(obj, (bytes, bytearray)):
+        return list(obj)
+    raise TypeError
+
+
+if orjson is not None:
+    def _dump_json(obj):
+        """Encode to JSON bytes (orjson already writes NaN/Infinity as null)"""
+        return orjson.dumps(obj, default=_bytes_to_list)
+
+    _load_json = orjson.loads
+else:
+    def _dump_json(obj):
+        """Encode to JSON bytes, converting NaN/Infinity to null"""
+        return json.dumps(sanitize_for_json(obj)).encode('utf-8')
+
+    _load_json = json.loads
+
+
+def _build_message_tables():
+    """
+    Build the dialect lookup tables shared by every protocol instance:
+    - message class by name: "HEARTBEAT" -> MAVLink_heartbeat_message
+    - (FIELD, field, default) spec by name, used by write_data
+    - (name, fieldnames, char fieldnames) spec by msg_id, used by read_data
+    """
+    msg_classes = {}
+    msg_field_specs = {}
+    msg_dict_specs = {}
+    for msg_id, cls in mavlink2.mavlink_map.items():
+        msg_classes[cls.msgname] = cls
+        msg_field_specs[cls.msgname] = tuple(
+            (field.upper(), field, '' if 'char' in ftype else 0)
+            for field, ftype in zip(cls.fieldnames, cls.fieldtypes)
+        )
+        msg_dict_specs[msg_id] = (
+            cls.msgname,
+            tuple(cls.fieldnames),
+            tuple(field for field, ftype in zip(cls.fieldnames, cls.fieldtypes) if 'char' in ftype),
+        )
+    return msg_classes, msg_field_specs, msg_dict_specs
+
+
 class MavlinkProtocol(Protocol):
     """MAVLink v2 Protocol using pymavlink"""
 
@@ -47,34 +100,57 @@ class MavlinkProtocol(Protocol):
     MAVLINK_HEADER_LEN = 10
     MAVLINK_CRC_LEN = 2
     MAVLINK_SIGNATURE_LEN = 13
+    # STX, len, incompat_flags, compat_flags, seq, sysid, compid, msgid (24-bit)
+    MAVLINK_HEADER_STRUCT = struct.Struct('<BBBBBBBHB')
+
+    # Consumed bytes are only trimmed from the receive buffer once the
+    # read cursor passes this many bytes and covers at least half the buffer
+    BUFFER_COMPACT_THRESHOLD = 4096
+
+    # Only every Nth decode error is logged so a noisy link can't flood the log
+    DECODE_ERROR_LOG_INTERVAL = 100
+
+    # Dialect lookup tables, built once at import rather than per instance
+    _msg_classes, _msg_field_specs, _msg_dict_specs = _build_message_tables()
 
     def __init__(self, gcs_sysid=255, gcs_compid=0, target_sysid=0, allow_empty_data=None):
-        super().__init__(allow_empty_data)
         self.gcs_sysid = int(gcs_sysid)
         self.gcs_compid = int(gcs_compid)
         self.target_sysid = int(target_sysid)
 
-        # MAVLink parser
+        # MAVLink parser (created before the parent init, which calls reset())
         self.mav = mavlink2.MAVLink(None, srcSystem=self.gcs_sysid, srcComponent=self.gcs_compid)
-        logger.info(f"Initialized MAVLink protocol: sysid={self.gcs_sysid}, compid={self.gcs_compid}")
-
-        # Build message class lookup: "HEARTBEAT" -> MAVLink_heartbeat_message
-        self._msg_classes = {}
-        for msg_id, cls in mavlink2.mavlink_map.items():
-            self._msg_classes[cls.msgname] = cls
+        super().__init__(allow_empty_data)
+        logger.info("Initialized MAVLink protocol: sysid=%d, compid=%d", self.gcs_sysid, self.gcs_compid)
 
         # Buffer for incoming data (bytearray for efficient appending
-        # and because pymavlink's decode() requires bytearray)
+        # and because pymavlink's decode() requires bytearray). _buf_pos is
+        # the read cursor: bytes before it have already been consumed.
         self.buffer = bytearray()
+        self._buf_pos = 0
 
     def reset(self):
         """Reset the protocol state"""
         logger.debug("Protocol reset called")
         super().reset()
         self.buffer = bytearray()
-        # Only reinitialize mav if attributes are set (handles parent init calling reset)
-        if hasattr(self, 'gcs_sysid') and hasattr(self, 'gcs_compid'):
-            self.mav = mavlink2.MAVLink(None, srcSystem=self.gcs_sysid, srcComponent=self.gcs_compid)
+        self._buf_pos = 0
+        self._reset_mav()
+
+    def _reset_mav(self):
+        """Reset the MAVLink parser's stream state in place instead of rebuilding it"""
+        mav = self.mav
+        mav.seq = 0
+        mav.buf = bytearray()
+        mav.buf_index = 0
+        mav.expected_length = mavlink2.HEADER_LEN_V1 + 2
+        mav.have_prefix_error = False
+        mav.total_packets_sent = 0
+        mav.total_bytes_sent = 0
+        mav.total_packets_received = 0
+        mav.total_bytes_received = 0
+        mav.total_receive_errors = 0
+        mav.signing = mavlink2.MAVLinkSigning()
 
     def read_data(self, data, extra=None):
         """
@@ -87,94 +163,145 @@ class MavlinkProtocol(Protocol):
         Returns:
             Tuple of (packet_data, extra) or ('STOP', extra) if need more data
         """
-        self.buffer += data
+        # Bind the attributes used on every iteration to locals
+        buffer = self.buffer
+        mav = self.mav
+        known_msg_ids = mavlink2.mavlink_map
+        msg_dict_specs = self._msg_dict_specs
+        target_sysid = self.target_sysid
+        unpack_header = self.MAVLINK_HEADER_STRUCT.unpack_from
+        stx = self.MAVLINK_STX
+        header_len = self.MAVLINK_HEADER_LEN
+        crc_len = self.MAVLINK_CRC_LEN
+        signed_len = self.MAVLINK_SIGNATURE_LEN
+        compact_threshold = self.BUFFER_COMPACT_THRESHOLD
+
+        buffer.extend(data)
+        mav.total_bytes_received += len(data)
 
         while True:
+            pos = self._buf_pos
+
+            # Drop consumed bytes only once the read cursor has moved far
+            # enough, instead of re-slicing the buffer for every packet.
+            # Waiting until at least half the buffer is consumed keeps the
+            # total bytes moved linear even when a large burst is queued.
+            if pos > compact_threshold and pos * 2 > len(buffer):
+                del buffer[:pos]
+                pos = self._buf_pos = 0
+
+            available = len(buffer) - pos
+
             # Need at least 1 byte to check magic
-            if len(self.buffer) < 1:
+            if available < 1:
+                buffer.clear()
+                self._buf_pos = 0
                 return 'STOP', extra
 
-            # Look for MAVLink v2 sync byte (0xFD)
-            if self.buffer[0] != self.MAVLINK_STX:
-                self.buffer = self.buffer[1:]
+            # Look for MAVLink v2 sync byte (0xFD), skipping any garbage in
+            # front of it with a single scan
+            if buffer[pos] != stx:
+                sync = buffer.find(stx, pos)
+                if sync < 0:
+                    buffer.clear()
+                    self._buf_pos = 0
+                    return 'STOP', extra
+                self._buf_pos = sync
                 continue
 
             # Need full header to determine packet length
-            if len(self.buffer) < self.MAVLINK_HEADER_LEN:
+            if available < header_len:
                 return 'STOP', extra
 
-            # Get payload length from byte 1
-            payload_len = self.buffer[1]
+            # Unpack the whole header in one call
+            (_, payload_len, incompat_flags, _, seq, sysid, compid,
+             msgid_low, msgid_high) = unpack_header(buffer, pos)
+            msg_id = msgid_low | (msgid_high << 16)
 
             # Check for signed packet (incompat_flags bit 0)
-            incompat_flags = self.buffer[2]
-            signature_len = self.MAVLINK_SIGNATURE_LEN if (incompat_flags & 0x01) else 0
+            signature_len = signed_len if (incompat_flags & 0x01) else 0
 
             # Calculate total packet length
-            total_len = self.MAVLINK_HEADER_LEN + payload_len + self.MAVLINK_CRC_LEN + signature_len
+            total_len = header_len + payload_len + crc_len + signature_len
 
             # Wait for complete packet
-            if len(self.buffer) < total_len:
+            if available < total_len:
                 return 'STOP', extra
 
-            # Extract the complete packet
-            packet_data = self.buffer[:total_len]
-            self.buffer = self.buffer[total_len:]
+            # Skip messages not in the dialect (development extensions, etc.)
+            # straight from the header, without copying or decoding them
+            if msg_id not in known_msg_ids:
+                self._buf_pos = pos + total_len
+                logger.debug("Skipping unknown message: UNKNOWN_%d", msg_id)
+                continue
+
+            # Filter by system ID if specified, also before copying the packet
+            if target_sysid != 0 and sysid != target_sysid:
+                self._buf_pos = pos + total_len
+                continue
+
+            # Extract the complete packet and advance the read cursor past it
+            packet_data = buffer[pos:pos + total_len]
+            self._buf_pos = pos + total_len
 
             # Decode the pre-framed packet with pymavlink
             # Use decode() instead of parse_char() to avoid dual-buffering issues.
             # parse_char() maintains its own internal buffer/state machine which
             # conflicts with our manual framing, causing state corruption and
-            # UNKNOWN_X / MSGID -2 errors.
+            # UNKNOWN_X / MSGID -2 errors. Since decode() bypasses parse_char(),
+            # the parser's receive counters are kept up to date here instead.
             try:
-                msg = self.mav.decode(packet_data)
-
-                # Skip messages not in the dialect (development extensions, etc.)
-                if msg.get_msgId() < 0:
-                    logger.debug(f"Skipping unknown message: {msg.get_type()}")
-                    continue
-
-                # Filter by system ID if specified
-                if self.target_sysid != 0 and msg.get_srcSystem() != self.target_sysid:
-                    continue
-
-                # Convert to JSON for COSMOS
-                msg_dict = msg.to_dict()
-
-                # Remove internal pymavlink fields
-                msg_dict.pop('mavpackettype', None)
-
-                # Add metadata
-                msg_dict['MSGID'] = msg.get_msgId()
-                msg_dict['MSGNAME'] = msg.get_type()
-                msg_dict['SYSTEM_ID'] = msg.get_srcSystem()
-                msg_dict['COMPONENT_ID'] = msg.get_srcComponent()
-                msg_dict['SEQ'] = msg.get_seq()
-
-                # Sanitize NaN/Infinity values to null for valid JSON
-                msg_dict = sanitize_for_json(msg_dict)
-
-                # Return as JSON bytes
-                return json.dumps(msg_dict).encode('utf-8'), extra
+                msg = mav.decode(packet_data)
+                mav.total_packets_received += 1
+
+                # Convert to JSON for COSMOS. Start from the metadata (from the
+                # unpacked header and the cached spec) as a constant-key dict,
+                # then read the decoded fields directly rather than through
+                # msg.to_dict(), decoding char fields the same way pymavlink's
+                # format_attr() does.
+                msg_name, fieldnames, char_fields = msg_dict_specs[msg_id]
+                msg_dict = {
+                    'MSGID': msg_id,
+                    'MSGNAME': msg_name,
+                    'SYSTEM_ID': sysid,
+                    'COMPONENT_ID': compid,
+                    'SEQ': seq,
+                }
+                values = msg.__dict__
+                for field in fieldnames:
+                    msg_dict[field] = values[field]
+                for field in char_fields:
+                    value = msg_dict[field]
+                    if isinstance(value, bytes):
+                        msg_dict[field] = value.decode(errors='backslashreplace').rstrip('\x00')
+
+                # Return as JSON bytes (NaN/Infinity become null)
+                return _dump_json(msg_dict), extra
 
             except Exception as e:
-                logger.warning(f"MAVLink decode error: {e}")
+                mav.total_receive_errors += 1
+                if (mav.total_receive_errors - 1) % self.DECODE_ERROR_LOG_INTERVAL == 0:
+                    logger.warning("MAVLink decode error: %s (%d total)", e, mav.total_receive_errors)
                 continue
 
     def write_data(self, data, extra=None):
         """Convert JSON command to MAVLink v2 binary packet"""
         try:
-            if isinstance(data, (bytes, bytearray)):
-                cmd = json.loads(data.decode('utf-8'))
-            elif isinstance(data, str):
-                cmd = json.loads(data)
+            if isinstance(data, (bytes, bytearray, str)):
+                cmd = _load_json(data)
             else:
                 cmd = data
 
-            msg_name = cmd.get('MSGNAME', '').upper()
-            msg_class = self._msg_classes.get(msg_name)
+            # COSMOS already sends upper case names, so only normalize on a miss
+            msg_classes = self._msg_classes
+            msg_name = cmd.get('MSGNAME', '')
+            msg_class = msg_classes.get(msg_name)
             if msg_class is None:
-                raise ValueError(f"Unknown MAVLink message type: {msg_name}")
+                msg_name = msg_name.upper()
+                msg_class = msg_classes.get(msg_name)
+            if msg_class is None:
+                logger.warning("Unknown MAVLink message type: %s", msg_name)
+                return data, extra
 
             # For COMMAND_LONG, remap friendly param names (e.g. ARM_1 -> PARAM1)
             if msg_name == 'COMMAND_LONG':
@@ -187,24 +314,21 @@ class MavlinkProtocol(Protocol):
                         remapped[upper_key] = value
                 cmd = remapped
 
-            # Build kwargs matching pymavlink's expected field names
-            field_kwargs = {}
-            for i, field in enumerate(msg_class.fieldnames):
-                field_upper = field.upper()
-                if field_upper in cmd:
-                    field_kwargs[field] = cmd[field_upper]
-                elif field in cmd:
-                    field_kwargs[field] = cmd[field]
-                else:
-                    ftype = msg_class.fieldtypes[i]
-                    field_kwargs[field] = '' if 'char' in ftype else 0
-
-            msg = msg_class(**field_kwargs)
-            packet = msg.pack(self.mav)
-            self.mav.seq = (self.mav.seq + 1) % 256
+            # Collect field values in pymavlink's constructor order, preferring
+            # the upper case COSMOS parameter name over the raw field name
+            cmd_get = cmd.get
+            field_values = [
+                cmd_get(field_upper, cmd_get(field, default))
+                for field_upper, field, default in self._msg_field_specs[msg_name]
+            ]
+
+            mav = self.mav
+            msg = msg_class(*field_values)
+            packet = msg.pack(mav)
+            mav.seq = (mav.seq + 1) % 256
 
             return packet, extra
 
         except Exception as e:
-            logger.error(f"Failed to encode MAVLink message: {e}")
+            logger.error("Failed to encode MAVLink message: %s", e)
             return data, extra